@@ -36,9 +36,13 @@
 
 import os
 import sys
+import inspect
+import numbers
 import numpy as np
-from decorator import decorator
 import argparse
+from copy import copy
+from functools import wraps
+from itertools import chain
 
 from pyop2.exceptions import DataTypeError, DataValueError
 from pyop2.configuration import configuration
@@ -48,7 +52,11 @@ class cached_property(object):
 
     '''A read-only @property that is only evaluated once. The value is cached
     on the object itself rather than the function or class; this should prevent
-    memory leakage.'''
+    memory leakage.
+
+    This deliberately isn't :class:`functools.cached_property`: that is
+    also written in Python, is only available from Python 3.8, and until
+    3.12 serialises first accesses through a per-descriptor lock.'''
 
     def __init__(self, fget, doc=None):
         self.fget = fget
@@ -59,6 +67,8 @@ class cached_property(object):
     def __get__(self, obj, cls):
         if obj is None:
             return self
+        # Shadow ourselves in the instance dict, so that subsequent
+        # lookups never reach this descriptor.
         obj.__dict__[self.__name__] = result = self.fget(obj)
         return result
 
@@ -67,6 +77,8 @@ def as_tuple(item, type=None, length=None, allow_none=False):
     # Empty list if we get passed None
     if item is None:
         t = ()
+    elif item.__class__ is tuple:
+        t = item
     else:
         # Convert iterable to tuple...
         try:
@@ -74,7 +86,8 @@ def as_tuple(item, type=None, length=None, allow_none=False):
         # ... or create a list of a single item
         except (TypeError, NotImplementedError):
             t = (item,) * (length or 1)
-    if configuration["type_check"]:
+    # Only consult the configuration if there is something to check
+    if (length or type is not None) and configuration["type_check"]:
         if length and not len(t) == length:
             raise ValueError("Tuple needs to be of length %d" % length)
         if type is not None:
@@ -104,6 +117,10 @@ def as_type(obj, typ):
 
 def tuplify(xs):
     """Turn a data structure into a tuple tree."""
+    # Catch the common leaves up front rather than by failing to iterate
+    # them (strings would otherwise recurse forever)
+    if xs is None or isinstance(xs, (numbers.Number, np.generic, str)):
+        return xs
     try:
         return tuple(tuplify(x) for x in xs)
     except TypeError:
@@ -116,38 +133,51 @@ class validate_base:
 
     Formal parameters that don't exist in the definition of the function
     being decorated as well as actual arguments not being present when
-    the validation is called are silently ignored."""
+    the validation is called are silently ignored.
+
+    Whether to validate is decided on each call from
+    ``configuration["type_check"]``, so that it may still be toggled with
+    :func:`pyop2.op2.init` after the decorated functions are defined; when
+    it is off each call still pays one extra call frame plus the flag
+    lookup."""
 
     def __init__(self, *checks):
         self._checks = checks
 
     def __call__(self, f):
-        def wrapper(f, *args, **kwargs):
+        # Record what we learn about f on a copy of ourselves, so that a
+        # single validator instance may decorate several functions
+        v = copy(self)
+        # Look through any validators we are stacked on top of
+        inner = inspect.unwrap(f)
+        code = inner.__code__
+        v.nargs = code.co_argcount
+        v.defaults = inner.__defaults__ or ()
+        v.varnames = code.co_varnames
+        v.file = code.co_filename
+        v.line = code.co_firstlineno + 1
+        # Resolve the position of each checked argument once, dropping
+        # checks on names that aren't formal parameters of f
+        v._arg_checks = tuple((argname, v.varnames.index(argname), argcond, exception)
+                              for argname, argcond, exception in v._checks
+                              if argname in v.varnames)
+
+        @wraps(f)
+        def wrapper(*args, **kwargs):
             if configuration["type_check"]:
-                self.nargs = f.__code__.co_argcount
-                self.defaults = f.__defaults__ or ()
-                self.varnames = f.__code__.co_varnames
-                self.file = f.__code__.co_filename
-                self.line = f.__code__.co_firstlineno + 1
-                self.check_args(args, kwargs)
+                v.check_args(args, kwargs)
             return f(*args, **kwargs)
-        return decorator(wrapper, f)
+        return wrapper
 
     def check_args(self, args, kwargs):
-        for argname, argcond, exception in self._checks:
-            # If the argument argname is not present in the decorated function
-            # silently ignore it
-            try:
-                i = self.varnames.index(argname)
-            except ValueError:
-                # No formal parameter argname
-                continue
+        for argname, i, argcond, exception in self._arg_checks:
             # Try the argument by keyword first, and by position second.
             # If the argument isn't given, silently ignore it.
-            try:
-                arg = kwargs.get(argname)
-                arg = arg or args[i]
-            except IndexError:
+            if argname in kwargs:
+                arg = kwargs[argname]
+            elif i < len(args):
+                arg = args[i]
+            else:
                 # No actual parameter argname
                 continue
             # If the argument has a default value, also accept that (since the
@@ -246,7 +276,7 @@ def verify_reshape(data, dtype, shape, allow_none=False):
             return a
         except ValueError:
             raise DataValueError("Invalid data: expected %d values, got %d!" %
-                                 (np.prod(shape), np.asarray(data).size))
+                                 (np.prod(shape), a.size))
 
 
 def align(bytes, alignment=16):
@@ -256,7 +286,7 @@ def align(bytes, alignment=16):
 
 def flatten(iterable):
     """Flatten a given nested iterable."""
-    return (x for e in iterable for x in e)
+    return chain.from_iterable(iterable)
 
 
 def parser(description=None, group=False):
@@ -317,7 +347,8 @@ def trim(docstring):
 
 
 def strip(code):
-    return '\n'.join([l for l in code.splitlines() if l.strip() and l.strip() != ';'])
+    """Remove blank lines and lines consisting only of ``;`` from code."""
+    return '\n'.join([l for l in code.splitlines() if l.strip() not in ('', ';')])
 
 
 def get_petsc_dir():
@@ -43,6 +43,7 @@ from pyop2 import op2
 from pyop2 import exceptions
 from pyop2 import sequential
 from pyop2 import base
+from pyop2 import utils
 
 
 @pytest.fixture
@@ -205,6 +206,60 @@ class TestClassAPI:
         assert not issubclass(type(dat), op2.Set)
 
 
+class TestValidateAPI:
+
+    """Argument validation decorator tests"""
+
+    def test_stacked_validators(self):
+        "Stacked validators should all check the decorated function."
+        @utils.validate_type(('a', int, TypeError))
+        @utils.validate_in(('b', ('x', 'y'), ValueError))
+        def f(a, b='x'):
+            return a, b
+        assert f(1, b='y') == (1, 'y')
+        with pytest.raises(TypeError):
+            f('a')
+        with pytest.raises(ValueError):
+            f(1, 'z')
+
+    def test_shared_validator(self):
+        "A validator instance may decorate more than one function."
+        v = utils.validate_type(('name', str, TypeError))
+
+        @v
+        def f(name, x=None):
+            return name
+
+        @v
+        def g(x, y, name=None):
+            return name
+        assert f('a') == 'a'
+        assert g(1, 2, 'b') == 'b'
+        with pytest.raises(TypeError):
+            f(3)
+        with pytest.raises(TypeError):
+            g(1, 2, 3)
+
+
+class TestTuplifyAPI:
+
+    """tuplify unit tests"""
+
+    def test_tuplify_string(self):
+        "Strings should be returned unchanged."
+        assert utils.tuplify('ab') == 'ab'
+
+    def test_tuplify_none(self):
+        "None should be returned unchanged."
+        assert utils.tuplify(None) is None
+
+    def test_tuplify_nested(self):
+        "Nested lists and arrays should become a tuple tree."
+        t = utils.tuplify([np.array([1, 2], dtype=np.int32), [3, [4]]])
+        assert t == ((1, 2), (3, (4,)))
+        assert type(t[0]) is tuple
+
+
 class TestArgAPI:
 
     """